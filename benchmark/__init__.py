@@ -0,0 +1 @@
+"""PhD thesis benchmark graph generators"""
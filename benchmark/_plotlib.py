@@ -0,0 +1,52 @@
+"""
+Shared plotting setup for the benchmark graph generators
+Style, colors, data loading and figure output helpers
+"""
+
+import pandas as pd
+import matplotlib.style
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import os
+
+STYLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Color palette for algorithms
+COLORS = {
+    'SCEAH': '#1f77b4',   # Blue - baseline
+    'RCSECH': '#2ca02c',  # Green - energy-optimized
+    'FATS': '#d62728'     # Red - security-first
+}
+
+def apply_style(*overrides):
+    """Apply benchmark.mplstyle, then any override stylesheets from the benchmark directory"""
+    matplotlib.style.use([os.path.join(STYLE_DIR, name) for name in ('benchmark.mplstyle',) + overrides])
+
+def load_data(csv_file, runner):
+    """Load a results CSV with categorical key columns, or return None if it is missing"""
+    if not os.path.exists(csv_file):
+        print(f"Error: {csv_file} not found. Run {runner} first:")
+        print(f"  java -cp \"lib/*;bin\" org.workflowsim.benchmark.{runner}")
+        return None
+    df = pd.read_csv(csv_file, engine='pyarrow')
+    for col in ('Algorithm', 'Benchmark'):
+        if col in df:
+            df[col] = df[col].astype('category')
+    return df
+
+def create_dirs():
+    """Create output directory for graphs"""
+    os.makedirs('benchmark/graphs', exist_ok=True)
+
+def new_figure(figsize, **kwargs):
+    """Create an Agg-backed figure; pyplot is never imported, so no GUI backend gets selected"""
+    fig = Figure(figsize=figsize, **kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+def save_png(fig, base, dpi=300):
+    """Save figure as PNG with a tight bbox and return the bbox for its page in the bundled PDF"""
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    fig.savefig(base + '.png', dpi=dpi, bbox_inches=bbox)
+    return bbox
@@ -3,220 +3,146 @@ PhD Thesis Benchmark Graph Generator
 Generates publication-quality comparison graphs for fog computing schedulers
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.patches import Patch
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import multiprocessing as mp
+import sys
 import os
 
-# Set publication-quality style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['xtick.labelsize'] = 10
-plt.rcParams['ytick.labelsize'] = 10
+if __package__:
+    from ._plotlib import COLORS, apply_style, load_data, create_dirs, new_figure, save_png
+else:
+    from _plotlib import COLORS, apply_style, load_data, create_dirs, new_figure, save_png
 
-# Color palette for algorithms
-COLORS = {
-    'SCEAH': '#1f77b4',   # Blue - baseline
-    'RCSECH': '#2ca02c',  # Green - energy-optimized
-    'FATS': '#d62728'     # Red - security-first
-}
+# Declarative description of the line and grouped-bar figures rendered by render().
+# Each Spec is one output figure; each Panel is one subplot plotting `y` against
+# the spec's x column for every algorithm.
+Panel = namedtuple('Panel', ['y', 'ylabel', 'title', 'marker'])
+Spec = namedtuple('Spec', ['out', 'bench', 'x', 'x_scale', 'xlabel', 'kind', 'panels',
+                           'grid', 'figsize', 'layout', 'title_pad', 'legend_loc'])
 
-def load_data(csv_file='benchmark/results/benchmark_results.csv'):
-    """Load benchmark results"""
-    if not os.path.exists(csv_file):
-        print(f"Error: {csv_file} not found. Run BenchmarkSuite first.")
-        return None
-    return pd.read_csv(csv_file)
+SPECS = [
+    # Figure 1: Scalability - Makespan vs Task Count
+    Spec(out='fig1_scalability_makespan', bench='Scalability', x='TaskCount', x_scale=1,
+         xlabel='Number of Tasks', kind='line',
+         panels=[Panel('Makespan', 'Makespan (seconds)',
+                       'Algorithm Scalability: Makespan vs Task Count', 'o')],
+         grid=(1, 1), figsize=(10, 6), layout='tight', title_pad=20, legend_loc='upper left'),
+    # Figure 2: Scalability - Energy & Cost vs Task Count
+    Spec(out='fig2_scalability_energy_cost', bench='Scalability', x='TaskCount', x_scale=1,
+         xlabel='Number of Tasks', kind='line',
+         panels=[Panel('Energy', 'Energy Consumption (kWh)', 'Energy Consumption vs Task Count', 's'),
+                 Panel('Cost', 'Total Cost ($)', 'Total Cost vs Task Count', '^')],
+         grid=(1, 2), figsize=(14, 5), layout='tight', title_pad=15, legend_loc='upper left'),
+    # Figure 3: Cloud MIPS Impact - Bar Chart Comparison
+    Spec(out='fig3_cloud_mips_comparison', bench='CloudMIPS', x='CloudMIPS', x_scale=1,
+         xlabel='Cloud MIPS', kind='bar',
+         panels=[Panel(m, m, f'{m} vs Cloud Performance', None)
+                 for m in ['Makespan', 'Energy', 'Cost', 'Security']],
+         grid=(2, 2), figsize=(14, 10), layout='constrained', title_pad=10, legend_loc='best'),
+    # Figure 4: Security Level Impact - Line Charts
+    Spec(out='fig4_security_level_impact', bench='SecurityLevel', x='HighConfRatio', x_scale=100,
+         xlabel='High-Confidentiality Jobs (%)', kind='line',
+         panels=[Panel('Security', 'Security Score', 'Security Score vs Security Requirements', 'o'),
+                 Panel('Energy', 'Energy Consumption (kWh)', 'Energy Consumption vs Security Requirements', 'o'),
+                 Panel('Cost', 'Total Cost ($)', 'Total Cost vs Security Requirements', 'o'),
+                 Panel('Makespan', 'Makespan (seconds)', 'Makespan vs Security Requirements', 'o')],
+         grid=(2, 2), figsize=(14, 10), layout='constrained', title_pad=10, legend_loc='best'),
+]
 
-def create_output_dir():
-    """Create output directory for graphs"""
-    os.makedirs('benchmark/graphs', exist_ok=True)
-
-def plot_scalability_makespan(df):
-    """Figure 1: Scalability - Makespan vs Task Count"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    scalability_data = df[df['Benchmark'] == 'Scalability']
-    
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = scalability_data[scalability_data['Algorithm'] == algorithm]
-        ax.plot(data['TaskCount'], data['Makespan'], 
-               marker='o', linewidth=2.5, markersize=8,
-               label=algorithm, color=COLORS[algorithm])
-    
-    ax.set_xlabel('Number of Tasks', fontweight='bold')
-    ax.set_ylabel('Makespan (seconds)', fontweight='bold')
-    ax.set_title('Algorithm Scalability: Makespan vs Task Count', fontweight='bold', pad=20)
-    ax.legend(loc='upper left', frameon=True, shadow=True)
-    ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig1_scalability_makespan.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig1_scalability_makespan.pdf', bbox_inches='tight')
-    print("✓ Generated: fig1_scalability_makespan.png")
-    plt.close()
-
-def plot_scalability_energy_cost(df):
-    """Figure 2: Scalability - Energy & Cost vs Task Count"""
-    scalability_data = df[df['Benchmark'] == 'Scalability']
-    
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-    
-    # Energy subplot
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = scalability_data[scalability_data['Algorithm'] == algorithm]
-        ax1.plot(data['TaskCount'], data['Energy'], 
-                marker='s', linewidth=2.5, markersize=8,
-                label=algorithm, color=COLORS[algorithm])
-    
-    ax1.set_xlabel('Number of Tasks', fontweight='bold')
-    ax1.set_ylabel('Energy Consumption (kWh)', fontweight='bold')
-    ax1.set_title('Energy Consumption vs Task Count', fontweight='bold', pad=15)
-    ax1.legend(loc='upper left', frameon=True, shadow=True)
-    ax1.grid(True, alpha=0.3)
-    
-    # Cost subplot
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = scalability_data[scalability_data['Algorithm'] == algorithm]
-        ax2.plot(data['TaskCount'], data['Cost'], 
-                marker='^', linewidth=2.5, markersize=8,
-                label=algorithm, color=COLORS[algorithm])
+def render(spec, data):
+    """Render a line or grouped-bar figure described by a Spec from its benchmark's rows"""
+    algorithms = ['SCEAH', 'RCSECH', 'FATS']
     
-    ax2.set_xlabel('Number of Tasks', fontweight='bold')
-    ax2.set_ylabel('Total Cost ($)', fontweight='bold')
-    ax2.set_title('Total Cost vs Task Count', fontweight='bold', pad=15)
-    ax2.legend(loc='upper left', frameon=True, shadow=True)
-    ax2.grid(True, alpha=0.3)
+    # One reshape to x-value x (metric, algorithm) serves every panel
+    pivot = data.pivot_table(index=spec.x, columns='Algorithm',
+                             values=[p.y for p in spec.panels], observed=True).sort_index()
+    x_values = pivot.index.to_numpy() * spec.x_scale
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig2_scalability_energy_cost.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig2_scalability_energy_cost.pdf', bbox_inches='tight')
-    print("✓ Generated: fig2_scalability_energy_cost.png")
-    plt.close()
-
-def plot_cloud_mips_comparison(df):
-    """Figure 3: Cloud MIPS Impact - Bar Chart Comparison"""
-    cloud_data = df[df['Benchmark'] == 'CloudMIPS']
-    
-    metrics = ['Makespan', 'Energy', 'Cost', 'Security']
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    axes = axes.flatten()
-    
-    mips_values = sorted(cloud_data['CloudMIPS'].unique())
-    x = np.arange(len(mips_values))
-    width = 0.25
-    
-    for idx, metric in enumerate(metrics):
-        ax = axes[idx]
-        
-        for i, algorithm in enumerate(['SCEAH', 'RCSECH', 'FATS']):
-            data = cloud_data[cloud_data['Algorithm'] == algorithm]
-            values = [data[data['CloudMIPS'] == mips][metric].values[0] for mips in mips_values]
-            ax.bar(x + i*width, values, width, label=algorithm, color=COLORS[algorithm], alpha=0.8)
-        
-        ax.set_xlabel('Cloud MIPS', fontweight='bold')
-        ax.set_ylabel(metric, fontweight='bold')
-        ax.set_title(f'{metric} vs Cloud Performance', fontweight='bold', pad=10)
-        ax.set_xticks(x + width)
-        ax.set_xticklabels([f'{m}' for m in mips_values])
-        ax.legend(loc='best', frameon=True, shadow=True)
-        ax.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig3_cloud_mips_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig3_cloud_mips_comparison.pdf', bbox_inches='tight')
-    print("✓ Generated: fig3_cloud_mips_comparison.png")
-    plt.close()
-
-def plot_security_level_impact(df):
-    """Figure 4: Security Level Impact - Line Charts"""
-    security_data = df[df['Benchmark'] == 'SecurityLevel']
+    fig = new_figure(spec.figsize, constrained_layout=spec.layout == 'constrained')
+    axes = fig.subplots(*spec.grid, squeeze=False).flatten()
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    axes = axes.flatten()
-    
-    metrics = [
-        ('Security', 'Security Score'),
-        ('Energy', 'Energy Consumption (kWh)'),
-        ('Cost', 'Total Cost ($)'),
-        ('Makespan', 'Makespan (seconds)')
-    ]
+    if spec.kind == 'bar':
+        # Flatten the grouped bars so each panel needs a single ax.bar call
+        x = np.arange(len(x_values))
+        width = 0.25
+        bar_x = np.concatenate([x + i*width for i in range(len(algorithms))])
+        bar_colors = [COLORS[a] for a in algorithms for _ in x_values]
+        handles = [Patch(facecolor=COLORS[a], alpha=0.8, label=a) for a in algorithms]
     
-    for idx, (metric, ylabel) in enumerate(metrics):
-        ax = axes[idx]
+    for ax, panel in zip(axes, spec.panels):
+        values = pivot[panel.y][algorithms].to_numpy(dtype=float)
         
-        for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-            data = security_data[security_data['Algorithm'] == algorithm]
-            high_conf_pct = data['HighConfRatio'] * 100
-            ax.plot(high_conf_pct, data[metric], 
-                   marker='o', linewidth=2.5, markersize=8,
-                   label=algorithm, color=COLORS[algorithm])
+        if spec.kind == 'line':
+            for i, algorithm in enumerate(algorithms):
+                ax.plot(x_values, values[:, i],
+                       marker=panel.marker, linewidth=2.5, markersize=8,
+                       label=algorithm, color=COLORS[algorithm])
+        else:
+            ax.bar(bar_x, values.T.ravel(), width, color=bar_colors, alpha=0.8)
+            ax.set_xticks(x + width)
+            ax.set_xticklabels([f'{v}' for v in x_values])
         
-        ax.set_xlabel('High-Confidentiality Jobs (%)', fontweight='bold')
-        ax.set_ylabel(ylabel, fontweight='bold')
-        ax.set_title(f'{ylabel.split(" (")[0]} vs Security Requirements', fontweight='bold', pad=10)
-        ax.legend(loc='best', frameon=True, shadow=True)
-        ax.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig4_security_level_impact.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig4_security_level_impact.pdf', bbox_inches='tight')
-    print("✓ Generated: fig4_security_level_impact.png")
-    plt.close()
+        ax.set_xlabel(spec.xlabel, fontweight='bold')
+        ax.set_ylabel(panel.ylabel, fontweight='bold')
+        ax.set_title(panel.title, fontweight='bold', pad=spec.title_pad)
+        if spec.kind == 'line':
+            ax.legend(loc=spec.legend_loc, frameon=True, shadow=True)
+            ax.grid(True, alpha=0.3)
+        else:
+            ax.legend(handles=handles, loc=spec.legend_loc, frameon=True, shadow=True)
+            ax.grid(True, alpha=0.3, axis='y')
+    
+    if spec.layout == 'tight':
+        fig.tight_layout()
+    bbox = save_png(fig, f'benchmark/graphs/{spec.out}')
+    print(f"✓ Generated: {spec.out}.png")
+    return fig, bbox
 
-def plot_tier_distribution(df):
+def plot_tier_distribution(by_bench):
     """Figure 5: Tier Distribution - Stacked Bar Chart"""
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig = new_figure((16, 5))
+    axes = fig.subplots(1, 3)
     
     benchmarks = ['Scalability', 'CloudMIPS', 'SecurityLevel']
     titles = ['Task Count Variation', 'Cloud MIPS Variation', 'Security Level Variation']
+    tiers = ['MistJobs', 'FogJobs', 'CloudJobs']
     
     for idx, (benchmark, title) in enumerate(zip(benchmarks, titles)):
         ax = axes[idx]
-        data = df[df['Benchmark'] == benchmark]
         
         algorithms = ['SCEAH', 'RCSECH', 'FATS']
         
-        # Get unique x-axis values
+        # Get x-axis column
         if benchmark == 'Scalability':
-            x_values = sorted(data['TaskCount'].unique())
+            x_col = 'TaskCount'
             x_label = 'Task Count'
         elif benchmark == 'CloudMIPS':
-            x_values = sorted(data['CloudMIPS'].unique())
+            x_col = 'CloudMIPS'
             x_label = 'Cloud MIPS'
         else:
-            x_values = sorted(data['HighConfRatio'].unique())
+            x_col = 'HighConfRatio'
             x_label = 'High-Conf Ratio'
         
+        # Tier percentages for every row at once, reshaped to x-value x algorithm
+        sub = by_bench[benchmark].copy()
+        totals = sub[tiers].sum(axis=1).replace(0, np.nan)
+        sub[['mist_pct', 'fog_pct', 'cloud_pct']] = sub[tiers].div(totals, axis=0).fillna(0).to_numpy(dtype=float) * 100
+        pivot = sub.pivot_table(index=x_col, columns='Algorithm',
+                                values=['mist_pct', 'fog_pct', 'cloud_pct'], observed=True)
+        x_values = pivot.index.values
+        
         x = np.arange(len(x_values))
         width = 0.25
         
         for i, algorithm in enumerate(algorithms):
-            algo_data = data[data['Algorithm'] == algorithm]
-            
-            mist_vals = []
-            fog_vals = []
-            cloud_vals = []
-            
-            for val in x_values:
-                if benchmark == 'Scalability':
-                    row = algo_data[algo_data['TaskCount'] == val]
-                elif benchmark == 'CloudMIPS':
-                    row = algo_data[algo_data['CloudMIPS'] == val]
-                else:
-                    row = algo_data[algo_data['HighConfRatio'] == val]
-                
-                if len(row) > 0:
-                    total = row['MistJobs'].values[0] + row['FogJobs'].values[0] + row['CloudJobs'].values[0]
-                    mist_vals.append(row['MistJobs'].values[0] / total * 100 if total > 0 else 0)
-                    fog_vals.append(row['FogJobs'].values[0] / total * 100 if total > 0 else 0)
-                    cloud_vals.append(row['CloudJobs'].values[0] / total * 100 if total > 0 else 0)
+            mist_vals = pivot['mist_pct'][algorithm].values
+            fog_vals = pivot['fog_pct'][algorithm].values
+            cloud_vals = pivot['cloud_pct'][algorithm].values
             
             # Stacked bars
             p1 = ax.bar(x + i*width, mist_vals, width, label='Mist' if i == 0 else "", 
@@ -224,7 +150,7 @@ def plot_tier_distribution(df):
             p2 = ax.bar(x + i*width, fog_vals, width, bottom=mist_vals, 
                        label='Fog' if i == 0 else "", color='#87CEEB', alpha=0.8)
             p3 = ax.bar(x + i*width, cloud_vals, width, 
-                       bottom=[m+f for m,f in zip(mist_vals, fog_vals)],
+                       bottom=mist_vals + fog_vals,
                        label='Cloud' if i == 0 else "", color='#FFB6C1', alpha=0.8)
             
             # Add algorithm label on top
@@ -244,21 +170,30 @@ def plot_tier_distribution(df):
         ax.legend(loc='upper right', frameon=True, shadow=True)
         ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig5_tier_distribution.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig5_tier_distribution.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/fig5_tier_distribution')
     print("✓ Generated: fig5_tier_distribution.png")
-    plt.close()
+    return fig, bbox
 
 def plot_security_energy_tradeoff(df):
     """Figure 6: Security vs Energy Trade-off - Scatter Plot"""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    # Dense marker layer is rasterized at 150 DPI; text and axes stay vector in the PDF
+    fig = new_figure((10, 7), dpi=150)
+    ax = fig.subplots()
     
+    # Single pass: scatter each algorithm's runs and annotate its mean point
+    groups = {a: g for a, g in df.groupby('Algorithm', observed=True)}
+    means = df.groupby('Algorithm', observed=True)[['Security', 'Energy']].mean()
     for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = df[df['Algorithm'] == algorithm]
+        data = groups[algorithm]
         ax.scatter(data['Security'], data['Energy'], 
                   s=200, alpha=0.7, label=algorithm, color=COLORS[algorithm],
-                  edgecolors='black', linewidths=1.5)
+                  edgecolors='black', linewidths=1.5, rasterized=True)
+        mean = means.loc[algorithm]
+        ax.annotate(f'{algorithm}\navg', xy=(mean['Security'], mean['Energy']),
+                   xytext=(10, 10), textcoords='offset points',
+                   bbox=dict(boxstyle='round,pad=0.5', fc=COLORS[algorithm], alpha=0.3),
+                   fontsize=9, fontweight='bold')
     
     ax.set_xlabel('Security Score', fontweight='bold', fontsize=13)
     ax.set_ylabel('Energy Consumption (kWh)', fontweight='bold', fontsize=13)
@@ -266,39 +201,44 @@ def plot_security_energy_tradeoff(df):
     ax.legend(loc='best', frameon=True, shadow=True, fontsize=12)
     ax.grid(True, alpha=0.3)
     
-    # Add annotations
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = df[df['Algorithm'] == algorithm]
-        avg_security = data['Security'].mean()
-        avg_energy = data['Energy'].mean()
-        ax.annotate(f'{algorithm}\navg', xy=(avg_security, avg_energy),
-                   xytext=(10, 10), textcoords='offset points',
-                   bbox=dict(boxstyle='round,pad=0.5', fc=COLORS[algorithm], alpha=0.3),
-                   fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig6_security_energy_tradeoff.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig6_security_energy_tradeoff.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/fig6_security_energy_tradeoff', dpi=150)
     print("✓ Generated: fig6_security_energy_tradeoff.png")
-    plt.close()
+    return fig, bbox
 
 def plot_reliability_comparison(df):
     """Figure 7: Reliability Comparison - Box Plot"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    data_to_plot = []
-    labels = []
-    colors_list = []
-    
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = df[df['Algorithm'] == algorithm]['Reliability'].values
-        data_to_plot.append(data)
-        labels.append(algorithm)
-        colors_list.append(COLORS[algorithm])
-    
-    bp = ax.boxplot(data_to_plot, labels=labels, patch_artist=True,
-                    notch=True, showmeans=True,
-                    meanprops=dict(marker='D', markerfacecolor='red', markersize=8))
+    fig = new_figure((10, 6))
+    ax = fig.subplots()
+    
+    algorithms = ['SCEAH', 'RCSECH', 'FATS']
+    colors_list = [COLORS[a] for a in algorithms]
+    
+    # Runs x algorithm matrix, NaN-padded if run counts differ
+    run_idx = df.groupby('Algorithm', observed=True).cumcount()
+    mat = df.pivot_table(index=run_idx, columns='Algorithm', values='Reliability', observed=True)
+    mat = mat[algorithms].to_numpy(dtype=float, na_value=np.nan)
+    
+    # Box statistics for all algorithms at once, using ax.boxplot's rules
+    # (1.5 IQR whiskers, notch at median +/- 1.57 IQR / sqrt(n))
+    valid = ~np.isnan(mat)
+    q1, med, q3 = np.nanpercentile(mat, [25, 50, 75], axis=0)
+    iqr = q3 - q1
+    inside = (mat >= q1 - 1.5 * iqr) & (mat <= q3 + 1.5 * iqr)
+    whislo = np.nanmin(np.where(inside, mat, np.nan), axis=0)
+    whishi = np.nanmax(np.where(inside, mat, np.nan), axis=0)
+    whislo = np.minimum(whislo, q1)  # Never end a whisker inside the box
+    whishi = np.maximum(whishi, q3)
+    notch = 1.57 * iqr / np.sqrt(valid.sum(axis=0))
+    means = np.nanmean(mat, axis=0)
+    
+    stats = [dict(label=a, med=med[i], q1=q1[i], q3=q3[i], whislo=whislo[i], whishi=whishi[i],
+                  mean=means[i], cilo=med[i] - notch[i], cihi=med[i] + notch[i],
+                  fliers=mat[valid[:, i] & ~inside[:, i], i])
+             for i, a in enumerate(algorithms)]
+    
+    bp = ax.bxp(stats, patch_artist=True, shownotches=True, showmeans=True,
+                meanprops=dict(marker='D', markerfacecolor='red', markersize=8))
     
     for patch, color in zip(bp['boxes'], colors_list):
         patch.set_facecolor(color)
@@ -313,21 +253,19 @@ def plot_reliability_comparison(df):
     ax.axhline(y=95, color='r', linestyle='--', linewidth=2, alpha=0.5, label='95% Threshold')
     ax.legend(loc='lower right', frameon=True, shadow=True)
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/fig7_reliability_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/fig7_reliability_comparison.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/fig7_reliability_comparison')
     print("✓ Generated: fig7_reliability_comparison.png")
-    plt.close()
+    return fig, bbox
 
-def generate_summary_table(df):
+def generate_summary_table(summary):
     """Generate LaTeX summary table"""
-    summary = df.groupby('Algorithm').agg({
-        'Makespan': ['mean', 'std'],
-        'Cost': ['mean', 'std'],
-        'Energy': ['mean', 'std'],
-        'Security': ['mean', 'std'],
-        'Reliability': ['mean', 'std']
-    }).round(4)
+    summary = summary.round(4)
+    
+    # Flatten to (algorithm x metric mean/std pairs) so rows are formatted from plain floats
+    algorithms = ['SCEAH', 'RCSECH', 'FATS']
+    metrics = ['Makespan', 'Cost', 'Energy', 'Security', 'Reliability']
+    values = summary.reindex(algorithms)[metrics].to_numpy(dtype=float)
     
     latex_file = 'benchmark/graphs/summary_table.tex'
     with open(latex_file, 'w') as f:
@@ -339,13 +277,10 @@ def generate_summary_table(df):
         f.write("\\textbf{Algorithm} & \\textbf{Makespan (s)} & \\textbf{Cost (\\$)} & \\textbf{Energy (kWh)} & \\textbf{Security} & \\textbf{Reliability (\\%)} \\\\\n")
         f.write("\\hline\n")
         
-        for algo in ['SCEAH', 'RCSECH', 'FATS']:
-            row = summary.loc[algo]
-            f.write(f"{algo} & {row[('Makespan', 'mean')]:.2f}±{row[('Makespan', 'std')]:.2f} & ")
-            f.write(f"{row[('Cost', 'mean')]:.4f}±{row[('Cost', 'std')]:.4f} & ")
-            f.write(f"{row[('Energy', 'mean')]:.4f}±{row[('Energy', 'std')]:.4f} & ")
-            f.write(f"{row[('Security', 'mean')]:.2f}±{row[('Security', 'std')]:.2f} & ")
-            f.write(f"{row[('Reliability', 'mean')]:.2f}±{row[('Reliability', 'std')]:.2f} \\\\\n")
+        row_tmpl = ("{} & {:.2f}±{:.2f} & {:.4f}±{:.4f} & {:.4f}±{:.4f} & "
+                    "{:.2f}±{:.2f} & {:.2f}±{:.2f} \\\\\n")
+        for algo, row in zip(algorithms, values):
+            f.write(row_tmpl.format(algo, *row))
         
         f.write("\\hline\n")
         f.write("\\end{tabular}\n")
@@ -353,38 +288,70 @@ def generate_summary_table(df):
     
     print(f"✓ Generated: summary_table.tex")
 
+def _run(task):
+    """Worker entry point: look up a plot function by name and render it"""
+    name, args = task
+    return globals()[name](*args)
+
 def main():
     print("=" * 80)
     print("PhD Thesis Graph Generator - Fog Computing Schedulers")
     print("=" * 80)
     
+    apply_style()
+    
     # Load data
-    df = load_data()
+    df = load_data('benchmark/results/benchmark_results.csv', 'BenchmarkSuite')
     if df is None:
         return
     
     print(f"\nLoaded {len(df)} benchmark results")
-    print(f"Algorithms: {df['Algorithm'].unique()}")
-    print(f"Benchmarks: {df['Benchmark'].unique()}")
+    print(f"Algorithms: {df['Algorithm'].unique().to_numpy()}")
+    print(f"Benchmarks: {df['Benchmark'].unique().to_numpy()}")
     
     # Create output directory
-    create_output_dir()
+    create_dirs()
+    
+    # Partition rows by benchmark once; each spec and plot reads its partition
+    by_bench = {k: v for k, v in df.groupby('Benchmark', observed=True, sort=False)}
     
     # Generate all graphs
     print("\nGenerating graphs...")
-    plot_scalability_makespan(df)
-    plot_scalability_energy_cost(df)
-    plot_cloud_mips_comparison(df)
-    plot_security_level_impact(df)
-    plot_tier_distribution(df)
-    plot_security_energy_tradeoff(df)
-    plot_reliability_comparison(df)
-    generate_summary_table(df)
+    tasks = [(render, (spec, by_bench[spec.bench])) for spec in SPECS] + [
+        (plot_tier_distribution, (by_bench,)),
+        (plot_security_energy_tradeoff, (df,)),
+        (plot_reliability_comparison, (df,)),
+    ]
+    # Figures are independent, so render them on separate cores; workers write the
+    # PNGs and hand each figure and its PNG bbox back to be appended to a single
+    # vector PDF in order (reusing the bbox skips a 'tight' trial draw per page).
+    workers = min(len(tasks), os.cpu_count() or 1)
+    jobs = [(fn.__name__, args) for fn, args in tasks]
+    with ExitStack() as stack:
+        pdf = stack.enter_context(PdfPages('benchmark/graphs/figures.pdf'))
+        if workers > 1:
+            # The pyarrow CSV reader has left threads running by now, so don't fork this
+            # process on Linux: forkserver children fork from a clean single-threaded server
+            ctx = mp.get_context('forkserver') if sys.platform.startswith('linux') else None
+            # Workers don't share the parent's rcParams, so each applies the style once at startup
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                                         initializer=apply_style))
+            results = ex.map(_run, jobs)
+        else:
+            # A single worker only adds start-up and pickling cost; render here with
+            # the style main() already applied
+            results = map(_run, jobs)
+        for fig, bbox in results:
+            pdf.savefig(fig, bbox_inches=bbox)
+    print("✓ Generated: figures.pdf")
+    
+    summary = df.groupby('Algorithm', observed=True)[['Makespan', 'Cost', 'Energy', 'Security', 'Reliability']].agg(['mean', 'std'])
+    generate_summary_table(summary)
     
     print("\n" + "=" * 80)
     print("All graphs generated successfully!")
     print("Output location: benchmark/graphs/")
-    print("Formats: PNG (300 DPI) + PDF (vector)")
+    print("Formats: PNG (300 DPI; fig6 at 150 DPI) + figures.pdf (vector, one page per figure)")
     print("=" * 80)
 
 if __name__ == '__main__':
@@ -3,41 +3,18 @@ Simple PhD Thesis Graph Generator
 Generates comparison graphs from benchmark results
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-import os
+from matplotlib.backends.backend_pdf import PdfPages
 
-# Publication quality settings
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 12
-plt.rcParams['font.family'] = 'DejaVu Sans'
+if __package__:
+    from ._plotlib import COLORS, apply_style, load_data, create_dirs, new_figure, save_png
+else:
+    from _plotlib import COLORS, apply_style, load_data, create_dirs, new_figure, save_png
 
-# Color palette
-COLORS = {
-    'SCEAH': '#1f77b4',   # Blue
-    'RCSECH': '#2ca02c',  # Green
-    'FATS': '#d62728'     # Red
-}
-
-def load_data():
-    """Load results CSV"""
-    file = 'benchmark/results/thesis_results.csv'
-    if not os.path.exists(file):
-        print(f"ERROR: {file} not found!")
-        print("Run: java -cp \"lib/*;bin\" org.workflowsim.benchmark.SimpleBenchmarkRunner")
-        return None
-    return pd.read_csv(file)
-
-def create_dirs():
-    """Create output directory"""
-    os.makedirs('benchmark/graphs', exist_ok=True)
-
-def plot_performance_comparison(df):
+def plot_performance_comparison(summary):
     """Main comparison chart - all metrics"""
-    fig, axes = plt.subplots(2, 3, figsize=(16, 10))
+    fig = new_figure((16, 10))
+    axes = fig.subplots(2, 3)
     axes = axes.flatten()
     
     metrics = [
@@ -51,70 +28,66 @@ def plot_performance_comparison(df):
     for metric, ylabel, idx in metrics:
         ax = axes[idx]
         
-        # Calculate mean and std for each algorithm
-        summary = df.groupby('Algorithm')[metric].agg(['mean', 'std']).reset_index()
+        # Mean and std for each algorithm
+        stats = summary[metric].reset_index()
         
-        x = np.arange(len(summary))
+        x = np.arange(len(stats))
         width = 0.6
         
-        bars = ax.bar(x, summary['mean'], width, 
-                     color=[COLORS[algo] for algo in summary['Algorithm']],
+        bars = ax.bar(x, stats['mean'], width, 
+                     color=[COLORS[algo] for algo in stats['Algorithm']],
                      alpha=0.8, edgecolor='black', linewidth=1.5)
         
         # Add error bars
-        ax.errorbar(x, summary['mean'], yerr=summary['std'],
+        ax.errorbar(x, stats['mean'], yerr=stats['std'],
                    fmt='none', ecolor='black', capsize=5, linewidth=2)
         
         # Labels
         ax.set_ylabel(ylabel, fontweight='bold', fontsize=13)
         ax.set_title(ylabel, fontweight='bold', fontsize=14, pad=10)
         ax.set_xticks(x)
-        ax.set_xticklabels(summary['Algorithm'], fontsize=12, fontweight='bold')
+        ax.set_xticklabels(stats['Algorithm'], fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
         
         # Add value labels on bars
-        for i, (mean, std) in enumerate(zip(summary['mean'], summary['std'])):
-            ax.text(i, mean + std + max(summary['mean'])*0.02, 
+        for i, (mean, std) in enumerate(zip(stats['mean'], stats['std'])):
+            ax.text(i, mean + std + max(stats['mean'])*0.02, 
                    f'{mean:.2f}', ha='center', va='bottom',
                    fontsize=10, fontweight='bold')
     
     # Remove extra subplot
     fig.delaxes(axes[5])
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/comparison_all_metrics.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/comparison_all_metrics.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/comparison_all_metrics')
     print("✓ Generated: comparison_all_metrics.png")
-    plt.close()
+    return fig, bbox
 
-def plot_radar_chart(df):
+def plot_radar_chart(summary):
     """Radar chart for multi-dimensional comparison"""
     from math import pi
     
-    # Normalize metrics to 0-1 scale
-    summary = df.groupby('Algorithm').mean()
-    
-    # Lower is better for these, so invert
-    for col in ['Makespan', 'Cost', 'Energy']:
-        max_val = summary[col].max()
-        summary[col] = 1 - (summary[col] / max_val)
-    
-    # Higher is better, normalize
-    for col in ['Security', 'Reliability']:
-        max_val = summary[col].max()
-        summary[col] = summary[col] / max_val
+    # Normalize metrics to 0-1 scale, inverting those where lower is better
+    lower = ['Makespan', 'Cost', 'Energy']
+    higher = ['Security', 'Reliability']
+    norm = summary.copy()
+    norm[lower] = 1 - summary[lower] / summary[lower].max()
+    norm[higher] = summary[higher] / summary[higher].max()
+    algorithms = ['SCEAH', 'RCSECH', 'FATS']
+    values_matrix = norm.loc[algorithms, lower + higher].to_numpy()
     
     categories = ['Makespan\n(Lower Better)', 'Cost\n(Lower Better)', 
                   'Energy\n(Lower Better)', 'Security\n(Higher Better)', 
                   'Reliability\n(Higher Better)']
     
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+    fig = new_figure((10, 10))
+    ax = fig.subplots(subplot_kw=dict(projection='polar'))
     
     angles = [n / len(categories) * 2 * pi for n in range(len(categories))]
     angles += angles[:1]
     
-    for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        values = summary.loc[algorithm, ['Makespan', 'Cost', 'Energy', 'Security', 'Reliability']].values.tolist()
+    for algorithm, row in zip(algorithms, values_matrix):
+        values = row.tolist()
         values += values[:1]
         
         ax.plot(angles, values, 'o-', linewidth=3, label=algorithm, 
@@ -131,27 +104,28 @@ def plot_radar_chart(df):
     ax.set_title('Multi-Dimensional Performance Comparison', 
                 y=1.08, fontweight='bold', fontsize=16)
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/radar_chart.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/radar_chart.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/radar_chart')
     print("✓ Generated: radar_chart.png")
-    plt.close()
+    return fig, bbox
 
-def plot_tradeoff_scatter(df):
+def plot_tradeoff_scatter(groups):
     """Security vs Energy tradeoff"""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    # Dense marker layer is rasterized at 150 DPI; text and axes stay vector in the PDF
+    fig = new_figure((10, 7), dpi=150)
+    ax = fig.subplots()
     
     for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = df[df['Algorithm'] == algorithm]
+        data = groups[algorithm]
         ax.scatter(data['Security'], data['Energy'],
                   s=250, alpha=0.7, label=algorithm, color=COLORS[algorithm],
-                  edgecolors='black', linewidth=2)
+                  edgecolors='black', linewidth=2, rasterized=True)
         
         # Add mean marker
         mean_sec = data['Security'].mean()
         mean_eng = data['Energy'].mean()
         ax.scatter(mean_sec, mean_eng, s=500, marker='*',
-                  color=COLORS[algorithm], edgecolors='black', linewidth=2)
+                  color=COLORS[algorithm], edgecolors='black', linewidth=2, rasterized=True)
     
     ax.set_xlabel('Security Score (Higher is Better)', fontweight='bold', fontsize=14)
     ax.set_ylabel('Energy Consumption in kWh (Lower is Better)', fontweight='bold', fontsize=14)
@@ -159,18 +133,18 @@ def plot_tradeoff_scatter(df):
     ax.legend(loc='best', fontsize=13, frameon=True, shadow=True)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/security_energy_tradeoff.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/security_energy_tradeoff.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/security_energy_tradeoff', dpi=150)
     print("✓ Generated: security_energy_tradeoff.png")
-    plt.close()
+    return fig, bbox
 
-def plot_cost_reliability(df):
+def plot_cost_reliability(groups):
     """Cost vs Reliability scatter"""
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig = new_figure((10, 7))
+    ax = fig.subplots()
     
     for algorithm in ['SCEAH', 'RCSECH', 'FATS']:
-        data = df[df['Algorithm'] == algorithm]
+        data = groups[algorithm]
         ax.scatter(data['Cost'], data['Reliability'],
                   s=250, alpha=0.7, label=algorithm, color=COLORS[algorithm],
                   edgecolors='black', linewidth=2)
@@ -187,23 +161,19 @@ def plot_cost_reliability(df):
     ax.grid(True, alpha=0.3)
     ax.axhline(y=95, color='r', linestyle='--', linewidth=2, alpha=0.5, label='95% Threshold')
     
-    plt.tight_layout()
-    plt.savefig('benchmark/graphs/cost_reliability_tradeoff.png', dpi=300, bbox_inches='tight')
-    plt.savefig('benchmark/graphs/cost_reliability_tradeoff.pdf', bbox_inches='tight')
+    fig.tight_layout()
+    bbox = save_png(fig, 'benchmark/graphs/cost_reliability_tradeoff')
     print("✓ Generated: cost_reliability_tradeoff.png")
-    plt.close()
+    return fig, bbox
 
-def generate_latex_table(df):
+def generate_latex_table(summary):
     """Generate LaTeX summary table"""
-    summary = df.groupby('Algorithm').agg({
-        'Makespan': ['mean', 'std'],
-        'Cost': ['mean', 'std'],
-        'Energy': ['mean', 'std'],
-        'Security': ['mean', 'std'],
-        'Reliability': ['mean', 'std']
-    })
+    # Flatten to (algorithm x metric mean/std pairs) so rows are formatted from plain floats
+    algorithms = ['SCEAH', 'RCSECH', 'FATS']
+    metrics = ['Makespan', 'Cost', 'Energy', 'Security', 'Reliability']
+    values = summary.reindex(algorithms)[metrics].to_numpy(dtype=float)
     
-    with open('benchmark/graphs/summary_table.tex', 'w') as f:
+    with open('benchmark/graphs/simple_summary_table.tex', 'w') as f:
         f.write("\\begin{table}[htbp]\n")
         f.write("\\centering\n")
         f.write("\\caption{Performance Metrics Comparison: SCEAH, RCSECH, and FATS Schedulers}\n")
@@ -213,25 +183,19 @@ def generate_latex_table(df):
         f.write("\\textbf{Algorithm} & \\textbf{Makespan (s)} & \\textbf{Cost (\\$)} & \\textbf{Energy (kWh)} & \\textbf{Security} & \\textbf{Reliability (\\%)} \\\\\n")
         f.write("\\hline\n")
         
-        for algo in ['SCEAH', 'RCSECH', 'FATS']:
-            row = summary.loc[algo]
-            f.write(f"\\textbf{{{algo}}} & ")
-            f.write(f"{row[('Makespan', 'mean')]:.2f} $\\pm$ {row[('Makespan', 'std')]:.2f} & ")
-            f.write(f"{row[('Cost', 'mean')]:.4f} $\\pm$ {row[('Cost', 'std')]:.4f} & ")
-            f.write(f"{row[('Energy', 'mean')]:.4f} $\\pm$ {row[('Energy', 'std')]:.4f} & ")
-            f.write(f"{row[('Security', 'mean')]:.2f} $\\pm$ {row[('Security', 'std')]:.2f} & ")
-            f.write(f"{row[('Reliability', 'mean')]:.2f} $\\pm$ {row[('Reliability', 'std')]:.2f} \\\\\n")
+        row_tmpl = ("\\textbf{{{}}} & {:.2f} $\\pm$ {:.2f} & {:.4f} $\\pm$ {:.4f} & "
+                    "{:.4f} $\\pm$ {:.4f} & {:.2f} $\\pm$ {:.2f} & {:.2f} $\\pm$ {:.2f} \\\\\n")
+        for algo, row in zip(algorithms, values):
+            f.write(row_tmpl.format(algo, *row))
         
         f.write("\\hline\n")
         f.write("\\end{tabular}\n")
         f.write("\\end{table}\n")
     
-    print("✓ Generated: summary_table.tex")
+    print("✓ Generated: simple_summary_table.tex")
 
-def generate_text_summary(df):
-    """Generate text summary"""
-    summary = df.groupby('Algorithm').mean()
-    
+def generate_text_summary(mean_df):
+    """Generate text summary from per-algorithm means"""
     with open('benchmark/graphs/summary.txt', 'w') as f:
         f.write("="*80 + "\n")
         f.write("BENCHMARK RESULTS SUMMARY\n")
@@ -239,20 +203,20 @@ def generate_text_summary(df):
         
         for algo in ['SCEAH', 'RCSECH', 'FATS']:
             f.write(f"\n{algo}:\n")
-            f.write(f"  Makespan:    {summary.loc[algo, 'Makespan']:.2f} seconds\n")
-            f.write(f"  Cost:        ${summary.loc[algo, 'Cost']:.4f}\n")
-            f.write(f"  Energy:      {summary.loc[algo, 'Energy']:.4f} kWh\n")
-            f.write(f"  Security:    {summary.loc[algo, 'Security']:.2f}\n")
-            f.write(f"  Reliability: {summary.loc[algo, 'Reliability']:.2f}%\n")
+            f.write(f"  Makespan:    {mean_df.loc[algo, 'Makespan']:.2f} seconds\n")
+            f.write(f"  Cost:        ${mean_df.loc[algo, 'Cost']:.4f}\n")
+            f.write(f"  Energy:      {mean_df.loc[algo, 'Energy']:.4f} kWh\n")
+            f.write(f"  Security:    {mean_df.loc[algo, 'Security']:.2f}\n")
+            f.write(f"  Reliability: {mean_df.loc[algo, 'Reliability']:.2f}%\n")
         
         f.write("\n" + "="*80 + "\n")
         f.write("BEST PERFORMERS:\n")
         f.write("="*80 + "\n")
-        f.write(f"  Fastest (Makespan):     {summary['Makespan'].idxmin()} ({summary['Makespan'].min():.2f}s)\n")
-        f.write(f"  Cheapest (Cost):        {summary['Cost'].idxmin()} (${summary['Cost'].min():.4f})\n")
-        f.write(f"  Most Efficient (Energy): {summary['Energy'].idxmin()} ({summary['Energy'].min():.4f} kWh)\n")
-        f.write(f"  Most Secure (Security):  {summary['Security'].idxmax()} ({summary['Security'].max():.2f})\n")
-        f.write(f"  Most Reliable:          {summary['Reliability'].idxmax()} ({summary['Reliability'].max():.2f}%)\n")
+        f.write(f"  Fastest (Makespan):     {mean_df['Makespan'].idxmin()} ({mean_df['Makespan'].min():.2f}s)\n")
+        f.write(f"  Cheapest (Cost):        {mean_df['Cost'].idxmin()} (${mean_df['Cost'].min():.4f})\n")
+        f.write(f"  Most Efficient (Energy): {mean_df['Energy'].idxmin()} ({mean_df['Energy'].min():.4f} kWh)\n")
+        f.write(f"  Most Secure (Security):  {mean_df['Security'].idxmax()} ({mean_df['Security'].max():.2f})\n")
+        f.write(f"  Most Reliable:          {mean_df['Reliability'].idxmax()} ({mean_df['Reliability'].max():.2f}%)\n")
     
     print("✓ Generated: summary.txt")
 
@@ -261,23 +225,35 @@ def main():
     print("PhD THESIS GRAPH GENERATOR")
     print("="*80)
     
-    df = load_data()
+    apply_style('benchmark_simple.mplstyle')
+    
+    df = load_data('benchmark/results/thesis_results.csv', 'SimpleBenchmarkRunner')
     if df is None:
         return
     
     print(f"\nLoaded {len(df)} results")
-    print(f"Algorithms: {df['Algorithm'].unique()}")
-    print(f"Runs per algorithm: {df.groupby('Algorithm').size().values[0]}")
+    print(f"Algorithms: {df['Algorithm'].unique().to_numpy()}")
+    print(f"Runs per algorithm: {df.groupby('Algorithm', observed=True).size().values[0]}")
     
     create_dirs()
     
+    # Slice once so plot functions look up their data instead of re-filtering
+    groups = {k: v.reset_index(drop=True) for k, v in df.groupby('Algorithm', observed=True, sort=False)}
+    
+    # Aggregate once and share between the consumers below
+    summary = df.groupby('Algorithm', observed=True).agg(['mean', 'std'])
+    mean_df = summary.xs('mean', level=1, axis=1)
+    
     print("\nGenerating graphs...")
-    plot_performance_comparison(df)
-    plot_radar_chart(df)
-    plot_tradeoff_scatter(df)
-    plot_cost_reliability(df)
-    generate_latex_table(df)
-    generate_text_summary(df)
+    with PdfPages('benchmark/graphs/simple_figures.pdf') as pdf:
+        for fig, bbox in (plot_performance_comparison(summary),
+                    plot_radar_chart(mean_df),
+                    plot_tradeoff_scatter(groups),
+                    plot_cost_reliability(groups)):
+            pdf.savefig(fig, bbox_inches=bbox)
+    print("✓ Generated: simple_figures.pdf")
+    generate_latex_table(summary)
+    generate_text_summary(mean_df)
     
     print("\n" + "="*80)
     print("COMPLETE! Output: benchmark/graphs/")
@@ -0,0 +1,20 @@
+"""
+Render All Benchmark Graphs
+Runs both graph generators in one session so pandas and matplotlib are imported once
+
+Usage (from the repository root):
+    python -m benchmark.render_all
+"""
+
+if __package__:
+    from . import generate_graphs, generate_simple_graphs
+else:
+    import generate_graphs
+    import generate_simple_graphs
+
+def main():
+    generate_graphs.main()
+    generate_simple_graphs.main()
+
+if __name__ == '__main__':
+    main()